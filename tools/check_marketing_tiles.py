@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Check that tiled marketing rendering stays within tolerance of a full render.
+
+Tiles sample the gradient ramps through a resize box and blur the glow at
+reduced scale, so they approximate gradient_background() rather than match it.
+This script compares both paths and re-reads streamed PNGs to verify the
+tolerance the generator relies on.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageFont
+
+import generate_app_store_assets as assets
+
+# Largest per-channel difference (out of 255) accepted between tiled and
+# full-canvas output.
+TOLERANCE = 4
+
+CANVAS_SIZES = ((1024, 500), (1600, 2400))
+TILE_ROWS = (37, 256)
+# Streamed canvases are also rendered in one tile for comparison, so wider
+# specs are scaled down to this width before the end-to-end check.
+MAX_STREAMED_WIDTH = 1280
+# One-row tiles put a seam through every row of the icon and text block; the
+# other heights mix short and tall tiles that straddle glyphs.
+STREAMED_TILE_ROWS = (1, 7, 41, 113)
+
+
+def max_channel_difference(a: Image.Image, b: Image.Image) -> int:
+    return max(high for _, high in ImageChops.difference(a, b).getextrema())
+
+
+def check_background_tiles() -> None:
+    for width, height in CANVAS_SIZES:
+        for spec in assets.MARKETING_SPECS:
+            full = assets.gradient_background(width, height, spec.palette)
+            for rows in (*TILE_ROWS, height):
+                tiled = Image.new("RGBA", (width, height))
+                for top in range(0, height, rows):
+                    bottom = min(height, top + rows)
+                    tiled.paste(assets.gradient_background_tile(width, height, spec.palette, top, bottom), (0, top))
+                diff = max_channel_difference(full, tiled)
+                if diff > TOLERANCE:
+                    raise SystemExit(
+                        f"{spec.name} palette at {width}x{height} with {rows}-row tiles differs by {diff}/255"
+                    )
+    print(f"Background tiles within {TOLERANCE}/255 of gradient_background().")
+
+
+def scalable_font(size: int, *, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    # Without the macOS fonts load_font() falls back to a tiny bitmap font whose
+    # glyphs rarely cross a tile seam, so the check pins a scalable one.
+    return ImageFont.load_default(size)
+
+
+def streamed_specs() -> list[assets.MarketingSpec]:
+    specs = []
+    for spec in assets.MARKETING_SPECS:
+        width, height = spec.size
+        if width > MAX_STREAMED_WIDTH:
+            spec = dataclasses.replace(spec, size=(MAX_STREAMED_WIDTH, height * MAX_STREAMED_WIDTH // width))
+        specs.append(spec)
+    return specs
+
+
+def check_streamed_canvas() -> None:
+    master = assets.make_master_icon(256)
+    load_font = assets.load_font
+    assets.load_font = scalable_font
+    try:
+        for spec in streamed_specs():
+            check_streamed_spec(spec, master)
+    finally:
+        assets.load_font = load_font
+
+
+def check_streamed_spec(spec: assets.MarketingSpec, master: Image.Image) -> None:
+    width, height = spec.size
+    with tempfile.TemporaryDirectory() as tmp:
+        single_path = Path(tmp) / "single.png"
+        tiled_path = Path(tmp) / "tiled.png"
+        assets.render_marketing_canvas(spec, master, single_path, memory_budget=1 << 40)
+        with Image.open(single_path) as single:
+            if single.size != spec.size:
+                raise SystemExit(f"{spec.name} PNG has the wrong size")
+            single_rgb = single.convert("RGB")
+
+        for rows in STREAMED_TILE_ROWS:
+            budget = assets.marketing_min_budget(spec) + width * assets.TILE_BYTES_PER_PIXEL * (rows - 1)
+            assets.render_marketing_canvas(spec, master, tiled_path, memory_budget=budget)
+            leftovers = sorted(path.name for path in Path(tmp).iterdir() if path.suffix == ".tmp")
+            if leftovers:
+                raise SystemExit(f"Temporary files left behind: {leftovers}")
+            with Image.open(tiled_path) as tiled:
+                if tiled.size != spec.size:
+                    raise SystemExit(f"{spec.name} PNG has the wrong size")
+                diff = max_channel_difference(single_rgb, tiled.convert("RGB"))
+            if diff > TOLERANCE:
+                raise SystemExit(f"{spec.name} at {width}x{height} with {rows}-row tiles differs by {diff}/255")
+    print(f"{spec.name} at {width}x{height}: streamed tiles agree within {TOLERANCE}/255.")
+
+
+def main() -> None:
+    check_background_tiles()
+    check_streamed_canvas()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,18 @@ Outputs:
 - output/app_store/icon/*
 - output/app_store/screenshots/*
 - output/app_store/metadata/*
+- output/app_store/marketing/* (opt-in via --marketing)
 
 Also refreshes launcher icons used by iOS/Android/Web from the same master icon.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
+import math
+import struct
+import zlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
@@ -23,6 +28,7 @@ OUTPUT_DIR = ROOT / "output" / "app_store"
 ICON_DIR = OUTPUT_DIR / "icon"
 SCREENSHOT_DIR = OUTPUT_DIR / "screenshots"
 METADATA_DIR = OUTPUT_DIR / "metadata"
+MARKETING_DIR = OUTPUT_DIR / "marketing"
 SOURCE_ICON_PATH = ROOT / "assets" / "branding" / "app_icon_source.png"
 
 IOS_ICONSET_JSON = ROOT / "ios" / "Runner" / "Assets.xcassets" / "AppIcon.appiconset" / "Contents.json"
@@ -103,6 +109,52 @@ TIERS: dict[str, tuple[int, int]] = {
 }
 
 
+@dataclass(frozen=True)
+class MarketingSpec:
+    name: str
+    size: tuple[int, int]
+    title: str
+    subtitle: str
+    palette: tuple[str, str, str, str]
+
+
+MARKETING_SPECS: Sequence[MarketingSpec] = (
+    MarketingSpec(
+        name="press_banner_8k",
+        size=(7680, 4320),
+        title="Petrol Log",
+        subtitle="Every fuel stop, mileage trend, and refill forecast in one place.",
+        palette=("#061A1B", "#0C5D58", "#0A2A2A", "#0F7C74"),
+    ),
+    MarketingSpec(
+        name="play_feature_graphic",
+        size=(1024, 500),
+        title="Petrol Log",
+        subtitle="Fuel tracking built for daily driving.",
+        palette=("#06191A", "#0B4A48", "#0A2424", "#0F6B65"),
+    ),
+    MarketingSpec(
+        name="print_poster_24x36",
+        size=(7200, 10800),
+        title="Know Your Mileage",
+        subtitle="Log fills in seconds and let Refuel Radar plan your next stop.",
+        palette=("#F7FCFB", "#DBF6F2", "#E9FFFC", "#C6EFE7"),
+    ),
+)
+
+# Marketing canvases are rendered in full-width horizontal tiles so peak memory
+# depends on the budget, not the output size. The per-pixel cost covers the
+# gradient masks, the colorized/blended RGBA layers, the upscaled glow, the
+# composite and the RGB row buffer that are alive while a tile is built. The
+# icon and shadow strips are built after the gradient layers are released and
+# fit inside the same per-pixel allowance.
+DEFAULT_TILE_BUDGET_MB = 96
+TILE_BYTES_PER_PIXEL = 28
+# The background glow is a very wide blur, so it is drawn and blurred at reduced
+# resolution and upscaled per tile; this keeps the blur overlap rows cheap.
+GLOW_DOWNSCALE = 8
+
+
 def ensure_dirs() -> None:
     ICON_DIR.mkdir(parents=True, exist_ok=True)
     SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
@@ -138,36 +190,109 @@ def load_font(size: int, *, bold: bool = False) -> ImageFont.FreeTypeFont | Imag
     return ImageFont.load_default()
 
 
-def gradient_background(width: int, height: int, palette: tuple[str, str, str, str]) -> Image.Image:
-    g_vertical = Image.linear_gradient("L").resize((width, height))
-    g_horizontal = Image.linear_gradient("L").rotate(90, expand=True).resize((width, height))
+def glow_ellipses(width: int, height: int) -> list[tuple[tuple[int, int, int, int], tuple[int, int, int, int]]]:
+    return [
+        (
+            (
+                int(width * -0.15),
+                int(height * -0.18),
+                int(width * 0.78),
+                int(height * 0.46),
+            ),
+            (255, 255, 255, 64),
+        ),
+        (
+            (
+                int(width * 0.30),
+                int(height * 0.44),
+                int(width * 1.02),
+                int(height * 1.20),
+            ),
+            (10, 150, 136, 42),
+        ),
+    ]
+
+
+def glow_blur_radius(width: int) -> int:
+    return max(6, width // 14)
+
+
+def gradient_layers(
+    width: int,
+    rows: int,
+    palette: tuple[str, str, str, str],
+    box: Optional[tuple[float, float, float, float]] = None,
+) -> Image.Image:
+    g_vertical = Image.linear_gradient("L").resize((width, rows), box=box)
+    g_horizontal = Image.linear_gradient("L").rotate(90, expand=True).resize((width, rows), box=box)
 
     c1, c2, c3, c4 = palette
     layer_a = ImageOps.colorize(g_vertical, c1, c2).convert("RGBA")
     layer_b = ImageOps.colorize(g_horizontal, c3, c4).convert("RGBA")
-    bg = Image.blend(layer_a, layer_b, 0.34)
+    return Image.blend(layer_a, layer_b, 0.34)
+
+
+def gradient_background(width: int, height: int, palette: tuple[str, str, str, str]) -> Image.Image:
+    bg = gradient_layers(width, height, palette)
 
     glow = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     d = ImageDraw.Draw(glow)
-    d.ellipse(
-        (
-            int(width * -0.15),
-            int(height * -0.18),
-            int(width * 0.78),
-            int(height * 0.46),
-        ),
-        fill=(255, 255, 255, 64),
-    )
-    d.ellipse(
-        (
-            int(width * 0.30),
-            int(height * 0.44),
-            int(width * 1.02),
-            int(height * 1.20),
+    for box, fill in glow_ellipses(width, height):
+        d.ellipse(box, fill=fill)
+    glow = glow.filter(ImageFilter.GaussianBlur(radius=glow_blur_radius(width)))
+    return Image.alpha_composite(bg, glow)
+
+
+def glow_overlap_rows(width: int) -> int:
+    # Pillow's GaussianBlur runs three box passes that each reach about one
+    # radius, so 3x the (downscaled) radius plus bicubic support covers a seam.
+    return math.ceil(3 * glow_blur_radius(width) / GLOW_DOWNSCALE) + 4
+
+
+def gradient_background_tile(
+    width: int,
+    height: int,
+    palette: tuple[str, str, str, str],
+    top: int,
+    bottom: int,
+) -> Image.Image:
+    """Render rows [top, bottom) of a full-canvas gradient background."""
+    rows = bottom - top
+    # The gradients are resized from a 256px ramp; sampling only this tile's
+    # slice of the ramp approximates a full-canvas resize. Together with the
+    # reduced-scale glow, tiles stay within 4/255 of gradient_background(), as
+    # checked by tools/check_marketing_tiles.py.
+    bg = gradient_layers(width, rows, palette, box=(0, top * 256 / height, 256, bottom * 256 / height))
+
+    glow_w = math.ceil(width / GLOW_DOWNSCALE)
+    glow_h = math.ceil(height / GLOW_DOWNSCALE)
+    overlap = glow_overlap_rows(width)
+    glow_top = max(0, top // GLOW_DOWNSCALE - overlap)
+    glow_bottom = min(glow_h, math.ceil(bottom / GLOW_DOWNSCALE) + overlap)
+
+    glow = Image.new("RGBA", (glow_w, glow_bottom - glow_top), (0, 0, 0, 0))
+    d = ImageDraw.Draw(glow)
+    for (x0, y0, x1, y1), fill in glow_ellipses(width, height):
+        d.ellipse(
+            (
+                x0 / GLOW_DOWNSCALE,
+                y0 / GLOW_DOWNSCALE - glow_top,
+                x1 / GLOW_DOWNSCALE,
+                y1 / GLOW_DOWNSCALE - glow_top,
+            ),
+            fill=fill,
+        )
+    glow = glow.filter(ImageFilter.GaussianBlur(radius=glow_blur_radius(width) / GLOW_DOWNSCALE))
+    glow = glow.resize(
+        (width, rows),
+        Image.Resampling.BICUBIC,
+        box=(
+            0,
+            top / GLOW_DOWNSCALE - glow_top,
+            width / GLOW_DOWNSCALE,
+            bottom / GLOW_DOWNSCALE - glow_top,
         ),
-        fill=(10, 150, 136, 42),
     )
-    glow = glow.filter(ImageFilter.GaussianBlur(radius=max(6, width // 14)))
     return Image.alpha_composite(bg, glow)
 
 
@@ -511,6 +636,306 @@ def generate_screenshots(master_icon: Image.Image) -> None:
             image.close()
 
 
+class PngRowWriter:
+    """Stream an 8-bit RGB PNG to disk one scanline at a time.
+
+    Rows go to a sibling ``.tmp`` file that only replaces ``path`` once IEND is
+    written, so a failed render never leaves a truncated PNG behind.
+    """
+
+    def __init__(self, path: Path, width: int, height: int, *, compress_level: int = 6) -> None:
+        self.path = path
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        # PNG filters treat the row above the first scanline as zeros.
+        self._previous_row = Image.new("RGB", (width, 1))
+        self._compressor = zlib.compressobj(compress_level)
+        self._tmp_path = path.with_name(f"{path.name}.tmp")
+        self._file = self._tmp_path.open("wb")
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    def __enter__(self) -> "PngRowWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _write_chunk(self, tag: bytes, data: bytes) -> None:
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(tag)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    def write_rows(self, tile: Image.Image) -> None:
+        if tile.mode != "RGB" or tile.width != self.width:
+            raise ValueError(f"Expected RGB rows {self.width}px wide, got {tile.mode} {tile.width}px")
+        if self.rows_written + tile.height > self.height:
+            raise ValueError(f"Too many rows for {self.path.name}: canvas is {self.height}px tall")
+        # Filter type 2 (Up) stores each byte minus the byte above it, which
+        # turns smooth vertical gradients into long runs zlib can compress.
+        # Only the last row of the previous tile has to be kept.
+        above = Image.new("RGB", tile.size)
+        above.paste(self._previous_row, (0, 0))
+        above.paste(tile.crop((0, 0, self.width, tile.height - 1)), (0, 1))
+        data = ImageChops.subtract_modulo(tile, above).tobytes()
+        del above
+        self._previous_row = tile.crop((0, tile.height - 1, self.width, tile.height))
+
+        stride = self.width * 3
+        for offset in range(0, len(data), stride):
+            compressed = self._compressor.compress(b"\x02" + data[offset : offset + stride])
+            if compressed:
+                self._write_chunk(b"IDAT", compressed)
+        self.rows_written += tile.height
+
+    def discard(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self.rows_written != self.height:
+            self.discard()
+            raise ValueError(f"{self.path.name} has {self.rows_written} of {self.height} rows")
+        try:
+            self._write_chunk(b"IDAT", self._compressor.flush())
+            self._write_chunk(b"IEND", b"")
+        except BaseException:
+            self.discard()
+            raise
+        self._file.close()
+        self._tmp_path.replace(self.path)
+
+
+def text_block_height(
+    draw: ImageDraw.ImageDraw,
+    lines: Iterable[str],
+    *,
+    font: ImageFont.ImageFont,
+    line_gap: int,
+) -> int:
+    total = 0
+    for line in lines:
+        bbox = draw.textbbox((0, 0), line, font=font)
+        total += (bbox[3] - bbox[1]) + line_gap
+    return total
+
+
+def text_ink_rows(
+    draw: ImageDraw.ImageDraw,
+    lines: Iterable[str],
+    *,
+    start_y: int,
+    font: ImageFont.ImageFont,
+    line_gap: int,
+) -> tuple[int, int]:
+    """Return the ``[top, bottom)`` rows inked by ``draw_centered_lines`` from ``start_y``."""
+    top, bottom = start_y, start_y
+    y = start_y
+    for index, line in enumerate(lines):
+        bbox = draw.textbbox((0, y), line, font=font)
+        top = bbox[1] if index == 0 else min(top, bbox[1])
+        bottom = max(bottom, bbox[3])
+        y += (bbox[3] - bbox[1]) + line_gap
+    return top, bottom
+
+
+def marketing_icon_edge(size: tuple[int, int]) -> int:
+    return int(min(size) * 0.26)
+
+
+def icon_shadow_geometry(icon_edge: int) -> tuple[int, int, int, int, int]:
+    """Return ``(radius, offset, blur, pad, scale)`` for a marketing icon and its shadow."""
+    radius = max(12, int(icon_edge * 0.22))
+    offset = max(4, icon_edge // 40)
+    blur = max(4, icon_edge // 24)
+    pad = blur * 3 + offset
+    scale = max(1, min(GLOW_DOWNSCALE, blur // 4))
+    return radius, offset, blur, pad, scale
+
+
+def make_icon_shadow(icon_edge: int) -> Image.Image:
+    # Like the glow, the soft shadow is blurred at reduced scale and upscaled
+    # per tile, so its footprint does not grow with the canvas.
+    radius, offset, blur, pad, scale = icon_shadow_geometry(icon_edge)
+    side = math.ceil((icon_edge + pad * 2) / scale)
+    shadow = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    ImageDraw.Draw(shadow).rounded_rectangle(
+        (pad / scale, (pad + offset) / scale, (pad + icon_edge) / scale, (pad + icon_edge + offset) / scale),
+        radius=max(1, round(radius / scale)),
+        fill=(0, 0, 0, 96),
+    )
+    return shadow.filter(ImageFilter.GaussianBlur(radius=blur / scale))
+
+
+def paste_icon_rows(
+    tile: Image.Image,
+    master_icon: Image.Image,
+    shadow: Image.Image,
+    *,
+    icon_x: int,
+    icon_y: int,
+    icon_edge: int,
+    top: int,
+) -> None:
+    """Composite the rows of the icon and its shadow that fall inside ``tile``."""
+    bottom = top + tile.height
+    radius, _, _, pad, scale = icon_shadow_geometry(icon_edge)
+
+    shadow_y = icon_y - pad
+    shadow_edge = icon_edge + pad * 2
+    row0, row1 = max(top, shadow_y), min(bottom, shadow_y + shadow_edge)
+    if row0 < row1:
+        strip = shadow.resize(
+            (shadow_edge, row1 - row0),
+            Image.Resampling.BICUBIC,
+            box=(0, (row0 - shadow_y) / scale, shadow_edge / scale, (row1 - shadow_y) / scale),
+        )
+        tile.paste(strip, (icon_x - pad, row0 - top), strip)
+
+    row0, row1 = max(top, icon_y), min(bottom, icon_y + icon_edge)
+    if row0 < row1:
+        source_edge = master_icon.height / icon_edge
+        strip = master_icon.resize(
+            (icon_edge, row1 - row0),
+            Image.Resampling.LANCZOS,
+            box=(0, (row0 - icon_y) * source_edge, master_icon.width, (row1 - icon_y) * source_edge),
+        ).convert("RGBA")
+        mask = Image.new("L", strip.size, 0)
+        ImageDraw.Draw(mask).rounded_rectangle(
+            (0, icon_y - row0, icon_edge, icon_y - row0 + icon_edge),
+            radius=radius,
+            fill=255,
+        )
+        strip.putalpha(mask)
+        tile.paste(strip, (icon_x, row0 - top), strip)
+
+
+def marketing_fixed_bytes(spec: MarketingSpec) -> int:
+    """Bytes held for a whole marketing render, independent of tile height."""
+    width, _ = spec.size
+    glow = 2 * (2 * glow_overlap_rows(width)) * math.ceil(width / GLOW_DOWNSCALE) * 4
+    icon_edge = marketing_icon_edge(spec.size)
+    _, _, _, pad, scale = icon_shadow_geometry(icon_edge)
+    # The reduced-scale shadow and its blurred copy.
+    shadow = 2 * math.ceil((icon_edge + pad * 2) / scale) ** 2 * 4
+    return glow + shadow
+
+
+def marketing_min_budget(spec: MarketingSpec) -> int:
+    return marketing_fixed_bytes(spec) + spec.size[0] * TILE_BYTES_PER_PIXEL
+
+
+def render_marketing_canvas(
+    spec: MarketingSpec,
+    master_icon: Image.Image,
+    out_path: Path,
+    *,
+    memory_budget: int = DEFAULT_TILE_BUDGET_MB * 1024 * 1024,
+) -> None:
+    """Render a large brand canvas in horizontal tiles under ``memory_budget`` bytes.
+
+    Each tile is composited, converted to RGB and streamed to ``out_path`` before
+    the next one is built, so peak memory stays flat regardless of canvas size.
+    """
+    width, height = spec.size
+    tile_rows = min(height, (memory_budget - marketing_fixed_bytes(spec)) // (width * TILE_BYTES_PER_PIXEL))
+    if tile_rows < 1:
+        raise ValueError(
+            f"{spec.name} needs a memory budget of at least "
+            f"{math.ceil(marketing_min_budget(spec) / (1024 * 1024))} MB"
+        )
+
+    short_edge = min(width, height)
+    icon_edge = marketing_icon_edge(spec.size)
+    shadow = make_icon_shadow(icon_edge)
+
+    title_font = load_font(max(56, short_edge // 9), bold=True)
+    subtitle_font = load_font(max(28, short_edge // 24), bold=False)
+    title_gap = max(10, short_edge // 90)
+    subtitle_gap = max(6, short_edge // 140)
+    measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+    max_text_w = int(width * 0.80)
+    title_lines = wrap_text(measure, spec.title, title_font, max_text_w)
+    subtitle_lines = wrap_text(measure, spec.subtitle, subtitle_font, max_text_w)
+    dark_theme = is_dark_color(spec.palette[0])
+    title_fill = (238, 255, 252, 246) if dark_theme else (8, 30, 31, 245)
+    subtitle_fill = (196, 235, 230, 226) if dark_theme else (19, 79, 79, 210)
+
+    icon_gap = max(24, short_edge // 22)
+    text_gap = max(12, short_edge // 60)
+    title_h = text_block_height(measure, title_lines, font=title_font, line_gap=title_gap)
+    subtitle_h = text_block_height(measure, subtitle_lines, font=subtitle_font, line_gap=subtitle_gap)
+    block_h = icon_edge + icon_gap + title_h + text_gap + subtitle_h
+    icon_x = (width - icon_edge) // 2
+    icon_y = max(0, (height - block_h) // 2)
+    title_y = icon_y + icon_edge + icon_gap
+    subtitle_y = title_y + title_h + text_gap
+    # Glyph ink starts below the draw origin and can run past the layout
+    # height, so tiles are matched against the inked rows instead.
+    title_ink = text_ink_rows(measure, title_lines, start_y=title_y, font=title_font, line_gap=title_gap)
+    subtitle_ink = text_ink_rows(measure, subtitle_lines, start_y=subtitle_y, font=subtitle_font, line_gap=subtitle_gap)
+    ink_top = min(title_ink[0], subtitle_ink[0])
+    ink_bottom = max(title_ink[1], subtitle_ink[1])
+
+    with PngRowWriter(out_path, width, height) as writer:
+        for top in range(0, height, tile_rows):
+            bottom = min(height, top + tile_rows)
+            tile = gradient_background_tile(width, height, spec.palette, top, bottom)
+            paste_icon_rows(
+                tile,
+                master_icon,
+                shadow,
+                icon_x=icon_x,
+                icon_y=icon_y,
+                icon_edge=icon_edge,
+                top=top,
+            )
+
+            draw = ImageDraw.Draw(tile)
+            if ink_top < bottom and ink_bottom > top:
+                draw_centered_lines(
+                    draw,
+                    title_lines,
+                    center_x=width // 2,
+                    start_y=title_y - top,
+                    font=title_font,
+                    fill=title_fill,
+                    line_gap=title_gap,
+                )
+                draw_centered_lines(
+                    draw,
+                    subtitle_lines,
+                    center_x=width // 2,
+                    start_y=subtitle_y - top,
+                    font=subtitle_font,
+                    fill=subtitle_fill,
+                    line_gap=subtitle_gap,
+                )
+            writer.write_rows(tile.convert("RGB"))
+
+
+def check_marketing_budget(memory_budget_mb: int) -> None:
+    required_mb = max(math.ceil(marketing_min_budget(spec) / (1024 * 1024)) for spec in MARKETING_SPECS)
+    if memory_budget_mb < required_mb:
+        raise ValueError(
+            f"memory budget of {memory_budget_mb} MB is too small for the marketing canvases; "
+            f"use at least {required_mb} MB"
+        )
+
+
+def generate_marketing_canvases(master_icon: Image.Image, memory_budget_mb: int = DEFAULT_TILE_BUDGET_MB) -> None:
+    check_marketing_budget(memory_budget_mb)
+    MARKETING_DIR.mkdir(parents=True, exist_ok=True)
+    for spec in MARKETING_SPECS:
+        out_path = MARKETING_DIR / f"{spec.name}.png"
+        render_marketing_canvas(spec, master_icon, out_path, memory_budget=memory_budget_mb * 1024 * 1024)
+
+
 def write_metadata_files() -> None:
     listing = """# App Store Listing Draft - Petrol Log
 
@@ -573,10 +998,16 @@ Set fuel price, currency, and appearance in a few taps.
 - android/app/src/main/res/mipmap-*/ic_launcher.png
 - web/icons/Icon-*.png
 
+## Marketing Canvases (opt-in: --marketing)
+- output/app_store/marketing/press_banner_8k.png
+- output/app_store/marketing/play_feature_graphic.png
+- output/app_store/marketing/print_poster_24x36.png
+
 ## Notes
 - Generated from one brand master icon for consistency.
 - iPad screenshots included because the current app supports iPad.
 - Brand icon source: assets/branding/app_icon_source.png
+- Marketing canvases render in horizontal tiles under --memory-budget-mb and stream rows straight to PNG.
 """
 
     (METADATA_DIR / "app_store_listing.md").write_text(listing, encoding="utf-8")
@@ -648,10 +1079,42 @@ def generate_icon_files() -> Image.Image:
     return master
 
 
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate Petrol Log store and marketing assets.")
+    parser.add_argument(
+        "--marketing",
+        action="store_true",
+        help="Also render large marketing canvases (8K banner, Play feature graphic, print poster).",
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=positive_int,
+        default=DEFAULT_TILE_BUDGET_MB,
+        help=f"Peak working memory for rendering each marketing canvas in MB (default: {DEFAULT_TILE_BUDGET_MB}).",
+    )
+    args = parser.parse_args()
+    if args.marketing:
+        # Fail before any icons or screenshots are rewritten.
+        try:
+            check_marketing_budget(args.memory_budget_mb)
+        except ValueError as error:
+            parser.error(str(error))
+
     ensure_dirs()
     master = generate_icon_files()
     generate_screenshots(master)
+    if args.marketing:
+        generate_marketing_canvases(master, args.memory_budget_mb)
     write_metadata_files()
     print("Generated App Store assets in:", OUTPUT_DIR)
 